@@ -1,125 +1,75 @@
 import streamlit as st
-import nltk
 from nltk.corpus import words
-import random
-import string
 import json
 
-# --- 1. Password Generator Class Definitions ---
-class RandomPasswordGenerator:
-    def __init__(self, length=12, include_upper=True, include_lower=True, include_digits=True, include_symbols=False, exclude_similar=False, no_repeated=False):
-        self.length = length
-        self.include_upper = include_upper
-        self.include_lower = include_lower
-        self.include_digits = include_digits
-        self.include_symbols = include_symbols
-        self.exclude_similar = exclude_similar
-        self.no_repeated = no_repeated
-
-    def generate(self):
-        chars = ""
-        if self.include_upper: chars += string.ascii_uppercase
-        if self.include_lower: chars += string.ascii_lowercase
-        if self.include_digits: chars += string.digits
-        if self.include_symbols: chars += string.punctuation
-
-        if self.exclude_similar:
-            for char in "Il1O0":
-                chars = chars.replace(char, "")
-
-        if not chars:
-            raise ValueError("No character types selected!")
-
-        if self.no_repeated and len(chars) < self.length:
-             raise ValueError("Not enough unique characters for the requested length.")
-
-        if self.no_repeated:
-            return "".join(random.sample(chars, self.length))
-        else:
-            return "".join(random.choice(chars) for _ in range(self.length))
-
-class MemorablePasswordGenerator:
-    def __init__(self, no_of_words=4, separator='-', capitalization=True, vocabulary=None, suffix_length=0):
-        self.no_of_words = no_of_words
-        self.separator = separator
-        self.capitalization = capitalization
-        self.vocabulary = vocabulary if vocabulary else ["apple", "banana", "cherry"]
-        self.suffix_length = suffix_length
-
-    def generate(self):
-        filtered_vocab = [w for w in self.vocabulary if 3 < len(w) < 8]
-        if not filtered_vocab:
-            filtered_vocab = self.vocabulary
-
-        selected_words = random.sample(filtered_vocab, self.no_of_words)
-        
-        if self.capitalization:
-            selected_words = [w.capitalize() for w in selected_words]
-        else:
-            selected_words = [w.lower() for w in selected_words]
-            
-        password = self.separator.join(selected_words)
-        
-        if self.suffix_length > 0:
-            suffix = "".join(random.choices(string.digits, k=self.suffix_length))
-            password += suffix
-            
-        return password
-
-class PinCodeGenerator:
-    def __init__(self, length=4):
-        self.length = length
-
-    def generate(self):
-        return "".join(random.choices(string.digits, k=self.length))
-
+# --- 1. Password Generators ---
+from password_generators import MemorablePasswordGenerator, PinCodeGenerator, RandomPasswordGenerator, ensure_words
 
 # --- 2. Page Config and State ---
 st.set_page_config(page_title="Password Generator", page_icon=":zap:", layout="centered")
 
-if "generator" not in st.session_state:
-    st.session_state.generator = None
-if "password" not in st.session_state:
-    st.session_state.password = None
-if "password_history" not in st.session_state:
-    st.session_state.password_history = []
-if "last_option" not in st.session_state:
-    st.session_state.last_option = None
+# Built on every script run, so the history list is fresh for each new session
+_SESSION_DEFAULTS = (
+    ("generator", None),
+    ("password", None),
+    ("password_history", []),
+    ("last_option", None),
+)
+for key, default in _SESSION_DEFAULTS:
+    st.session_state.setdefault(key, default)
 
 # --- 3. CSS Styles ---
+DARK_MODE_CSS = """
+<style>
+[data-testid="stAppViewContainer"], [data-testid="stHeader"] {
+    background-color: #0E1117 !important;
+    color: #FAFAFA !important;
+}
+h1, h2, h3, p, label, span, div, li {
+    color: #FAFAFA !important;
+}
+code {
+    background-color: #262730 !important;
+    color: #ff4b4b !important;
+}
+.stRadio div[role='radiogroup'] label {
+    color: #FAFAFA !important;
+}
+</style>
+"""
+
 def apply_dark_mode():
-    st.markdown(
-        """
-        <style>
-        [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
-            background-color: #0E1117 !important;
-            color: #FAFAFA !important;
-        }
-        h1, h2, h3, p, label, span, div, li {
-            color: #FAFAFA !important;
-        }
-        code {
-            background-color: #262730 !important;
-            color: #ff4b4b !important;
-        }
-        .stRadio div[role='radiogroup'] label {
-            color: #FAFAFA !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    # Streamlit drops elements that are not re-emitted on a rerun, so this must run every time
+    st.markdown(DARK_MODE_CSS, unsafe_allow_html=True)
 
 apply_dark_mode()
 
 # --- 4. Helper Functions ---
+# Byte -> class bit: 1 upper, 2 lower, 4 digit, 8 symbol (incl. any non-ASCII byte)
+_CLASS_TABLE = bytes(
+    1 if 65 <= b <= 90 else 2 if 97 <= b <= 122 else 4 if 48 <= b <= 57 else 8
+    for b in range(256)
+)
+
+def _classify(pw: str) -> int:
+    mask = 0
+    for bit in set(pw.encode("utf-8").translate(_CLASS_TABLE)):
+        mask |= bit
+    return mask
+
 def compute_strength(pw: str) -> tuple[int, str]:
     if not pw: return 0, "Weak"
+    # Like zxcvbn, only analyse the first 100 characters; the length score saturates long before that
+    pw = pw[:100]
     length = len(pw)
-    has_upper = any(c.isupper() for c in pw)
-    has_lower = any(c.islower() for c in pw)
-    has_digit = any(c.isdigit() for c in pw)
-    has_symbol = any((not c.isalnum()) for c in pw)
+    # Score saturates at 20+ characters with all four classes, so try a 20-character prefix first
+    mask = _classify(pw[:20])
+    if length > 20 and mask != 15:
+        mask = _classify(pw)
+    has_upper = bool(mask & 1)
+    has_lower = bool(mask & 2)
+    has_digit = bool(mask & 4)
+    has_symbol = bool(mask & 8)
     
     length_score = min(length - 4, 16) / 16 * 40 if length > 4 else 0
     classes = sum([has_upper, has_lower, has_digit, has_symbol])
@@ -135,13 +85,18 @@ def compute_strength(pw: str) -> tuple[int, str]:
     
     return score, label
 
-@st.cache_data
-def load_words():
-    try:
-        return words.words()
-    except LookupError:
-        nltk.download('words')
-        return words.words()
+def get_strength(pw: str) -> tuple[int, str]:
+    # Memoized per session rather than with lru_cache, so passwords never outlive the session
+    cached = st.session_state.get("strength")
+    if cached is None or cached[0] != pw:
+        cached = (pw, *compute_strength(pw))
+        st.session_state.strength = cached
+    return cached[1], cached[2]
+
+@st.cache_resource
+def load_filtered_words():
+    ensure_words()
+    return tuple(w for w in words.words() if 3 < len(w) < 8)
 
 # --- 5. User Interface ---
 try:
@@ -176,7 +131,15 @@ if option == 'Random Password':
         st.warning("⚠️ Please select at least one character type!")
         st.session_state.generator = None
     else:
-        st.session_state.generator = RandomPasswordGenerator(length, inc_upper, inc_lower, inc_num, inc_sym, exc_sim, no_rep)
+        st.session_state.generator = RandomPasswordGenerator(
+            length,
+            include_uppercase=inc_upper,
+            include_lowercase=inc_lower,
+            include_numbers=inc_num,
+            include_symbols=inc_sym,
+            exclude_similar=exc_sim,
+            no_repeated_characters=no_rep,
+        )
 
 elif option == 'Memorable Password':
     no_of_words = st.slider("Number of Words", 2, 10, 4)
@@ -187,97 +150,101 @@ elif option == 'Memorable Password':
         cap = st.checkbox("Capitalize words", value=True)
         suf = st.number_input("Suffix length", 0, 6, 0)
 
-    word_list = load_words()
-    st.session_state.generator = MemorablePasswordGenerator(no_of_words, sep, cap, word_list, suf)
+    word_list = load_filtered_words()
+    st.session_state.generator = MemorablePasswordGenerator(no_of_words, sep, cap, word_list, suffix_length=suf)
 
 else: # Pin Code
     length = st.slider("Length", 2, 50, 20)
     st.session_state.generator = PinCodeGenerator(length)
 
 # --- 7. Generate and Display Button ---
-if st.button("Generate New Password", type="primary"):
-    if st.session_state.generator:
+# Only this section reruns when the button or download widgets are used
+@st.fragment
+def password_section(option):
+    if st.button("Generate New Password", type="primary"):
+        if st.session_state.generator:
+            try:
+                new_pw = st.session_state.generator.generate()
+                st.session_state.password = new_pw
+                st.session_state.password_history.append(new_pw)
+            except ValueError as e:
+                st.error(f"❌ {str(e)}")
+
+    # If password is empty but generator exists (first run), generate one
+    if st.session_state.password is None and st.session_state.generator:
         try:
-            new_pw = st.session_state.generator.generate()
-            st.session_state.password = new_pw
-            st.session_state.password_history.append(new_pw)
-            st.rerun()
-        except ValueError as e:
-            st.error(f"❌ {str(e)}")
-
-# If password is empty but generator exists (first run), generate one
-if st.session_state.password is None and st.session_state.generator:
-    try:
-        init_pw = st.session_state.generator.generate()
-        st.session_state.password = init_pw
-        st.session_state.password_history.append(init_pw)
-    except ValueError:
-        pass
-
-# Display Output
-if st.session_state.password:
-    pw = st.session_state.password
-    st.write("Your password is:")
-    st.code(pw, language=None)
-
-    score, label = compute_strength(pw)
-    emoji_map = {"Weak": "🔴", "Medium": "🟠", "Strong": "🟡", "Very Strong": "🟢"}
+            init_pw = st.session_state.generator.generate()
+            st.session_state.password = init_pw
+            st.session_state.password_history.append(init_pw)
+        except ValueError:
+            pass
+
+    # Display Output
+    if st.session_state.password:
+        pw = st.session_state.password
+        st.write("Your password is:")
+        st.code(pw, language=None)
+
+        score, label = get_strength(pw)
+        emoji_map = {"Weak": "🔴", "Medium": "🟠", "Strong": "🟡", "Very Strong": "🟢"}
     
-    c1, c2 = st.columns([1, 3])
-    with c1:
-        st.markdown(f"<h4>{emoji_map.get(label)} {label}</h4>", unsafe_allow_html=True)
-    with c2:
-        st.progress(score / 100)
+        c1, c2 = st.columns([1, 3])
+        with c1:
+            st.markdown(f"<h4>{emoji_map.get(label)} {label}</h4>", unsafe_allow_html=True)
+        with c2:
+            st.progress(score / 100)
 
-st.write("---")
+    st.write("---")
 
-with st.expander("⬇️ Download and Save Generated Password"):
-    st.write("""
-    After generating a password, you can download it.
+    with st.expander("⬇️ Download and Save Generated Password"):
+        st.write("""
+        After generating a password, you can download it.
 
-    🔹 Download as TXT  
-    Only the password itself is saved in a simple text file.
+        🔹 Download as TXT  
+        Only the password itself is saved in a simple text file.
 
-    🔹 Download as JSON  
-    The password, along with its type and strength (score and security level), is saved in a JSON file.
-    """)
+        🔹 Download as JSON  
+        The password, along with its type and strength (score and security level), is saved in a JSON file.
+        """)
 
-    # --- Fix for repeated download bug ---
-    if st.session_state.password:
-        # Get password directly from session to avoid losing variable on rerun
-        current_password = st.session_state.password
+        # --- Fix for repeated download bug ---
+        if st.session_state.password:
+            # Get password directly from session to avoid losing variable on rerun
+            current_password = st.session_state.password
         
-        # Recompute info for JSON to ensure data integrity
-        current_score, current_label = compute_strength(current_password)
+            # Recompute info for JSON to ensure data integrity
+            current_score, current_label = get_strength(current_password)
         
-        # Prepare JSON content
-        json_payload = {
-            "password": current_password, 
-            "type": option, 
-            "strength": {"score": current_score, "label": current_label}
-        }
-        json_str_data = json.dumps(json_payload, ensure_ascii=False, indent=2)
-
-        # Display buttons
-        e1, e2 = st.columns(2)
-        with e1:
-            st.download_button(
-                label="Download as TXT",
-                data=current_password,
-                file_name="password.txt",
-                mime="text/plain",
-                key="download_txt_btn"
-            )
-        with e2:
-            st.download_button(
-                label="Download as JSON",
-                data=json_str_data,
-                file_name="password.json",
-                mime="application/json",
-                key="download_json_btn"
-            )
-    else:
-        st.info("⚠️ No password generated yet.")
+            # Prepare JSON content
+            json_payload = {
+                "password": current_password, 
+                "type": option, 
+                "strength": {"score": current_score, "label": current_label}
+            }
+            json_str_data = json.dumps(json_payload, ensure_ascii=False, indent=2)
+
+            # Display buttons
+            e1, e2 = st.columns(2)
+            with e1:
+                st.download_button(
+                    label="Download as TXT",
+                    data=current_password,
+                    file_name="password.txt",
+                    mime="text/plain",
+                    key="download_txt_btn"
+                )
+            with e2:
+                st.download_button(
+                    label="Download as JSON",
+                    data=json_str_data,
+                    file_name="password.json",
+                    mime="application/json",
+                    key="download_json_btn"
+                )
+        else:
+            st.info("⚠️ No password generated yet.")
+
+password_section(option)
 
 st.write("---")
 with st.expander("📖 Guide: Password Types, Privacy & Security"):
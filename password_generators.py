@@ -1,11 +1,49 @@
 import random
+import secrets
 import string
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 import nltk
 
-nltk.download('words')
+_rng = secrets.SystemRandom()
+# Visually similar characters: O, 0, l, 1, I
+_EXCLUDE_SIMILAR = b"O0l1I"
+_UPPER_B, _LOWER_B, _DIGITS_B, _PUNCT_B = (
+    s.encode('ascii') for s in (string.ascii_uppercase, string.ascii_lowercase, string.digits, string.punctuation)
+)
+_words_available = False
+
+
+def ensure_words() -> None:
+    """
+    Make sure the NLTK words corpus is installed, downloading it on first use only.
+    """
+    global _words_available
+    if _words_available:
+        return
+    try:
+        nltk.corpus.words.words()
+    except LookupError:
+        nltk.download('words', quiet=True)
+        # download() reports failure by returning False, so load again and let LookupError propagate
+        nltk.corpus.words.words()
+    _words_available = True
+
+
+def _random_digits(length: int) -> str:
+    """
+    Return a string of uniformly distributed digits drawn from the OS entropy pool.
+    """
+    digits: List[int] = []
+    while len(digits) < length:
+        # Bytes >= 250 are rejected so that "% 10" does not bias towards low digits
+        for b in secrets.token_bytes(length * 2):
+            if b < 250:
+                digits.append(_DIGITS_B[b % 10])
+                if len(digits) == length:
+                    break
+    return bytes(digits).decode('ascii')
 
 
 class PasswordGenerator(ABC):
@@ -27,20 +65,23 @@ class RandomPasswordGenerator(PasswordGenerator):
     def __init__(self, length: int = 8, include_uppercase: bool = True, include_lowercase: bool = True, include_numbers: bool = False, include_symbols: bool = False, exclude_similar: bool = False, no_repeated_characters: bool = False):
         self.length = length
         self.no_repeated_characters = no_repeated_characters
-        self.characters: str = ""
+        # ASCII character pool, kept as bytes so sampling never boxes single-char strings
+        self.characters: bytes = b""
         if include_uppercase:
-            self.characters += string.ascii_uppercase
+            self.characters += _UPPER_B
         if include_lowercase:
-            self.characters += string.ascii_lowercase
+            self.characters += _LOWER_B
         if include_numbers:
-            self.characters += string.digits
+            self.characters += _DIGITS_B
         if include_symbols:
-            self.characters += string.punctuation
-        
+            self.characters += _PUNCT_B
+
         # Exclude visually similar characters: O, 0, l, 1, I
         if exclude_similar:
-            similar_chars = "O0l1I"
-            self.characters = "".join(char for char in self.characters if char not in similar_chars)
+            self.characters = self.characters.translate(None, _EXCLUDE_SIMILAR)
+
+        if not self.characters:
+            raise ValueError("No character types selected!")
 
     def generate(self) -> str:
         """
@@ -49,9 +90,24 @@ class RandomPasswordGenerator(PasswordGenerator):
         if self.no_repeated_characters:
             if self.length > len(self.characters):
                 raise ValueError(f"Cannot generate password with {self.length} unique characters from a pool of {len(self.characters)} characters.")
-            return ''.join(random.sample(self.characters, self.length))
+            # Partial Fisher-Yates over a copy of the byte pool
+            buf = bytearray(self.characters)
+            n = len(buf)
+            for i in range(self.length):
+                j = _rng.randrange(i, n)
+                buf[i], buf[j] = buf[j], buf[i]
+            return buf[:self.length].decode('ascii')
         else:
-            return ''.join(random.choice(self.characters) for _ in range(self.length))
+            return bytes(_rng.choices(self.characters, k=self.length)).decode('ascii')
+
+    def generate_many(self, n: int) -> List[str]:
+        """
+        Generate n passwords, drawing all characters in a single batch when possible.
+        """
+        if self.no_repeated_characters:
+            return [self.generate() for _ in range(n)]
+        out = bytes(_rng.choices(self.characters, k=n * self.length)).decode('ascii')
+        return [out[i:i + self.length] for i in range(0, n * self.length, self.length)]
 
 
 class MemorablePasswordGenerator(PasswordGenerator):
@@ -63,11 +119,12 @@ class MemorablePasswordGenerator(PasswordGenerator):
         no_of_words: int = 5,
         separator: str = "-",
         capitalization: bool = False,
-        vocabulary: Optional[List[str]] = None,
+        vocabulary: Optional[Sequence[str]] = None,
         suffix_length: int = 0,
         rng_seed: Optional[int] = None,
     ):
         if vocabulary is None:
+            ensure_words()
             vocabulary = nltk.corpus.words.words()
 
         self.no_of_words: int = no_of_words
@@ -75,28 +132,29 @@ class MemorablePasswordGenerator(PasswordGenerator):
         # if True, capitalize first letter of each word
         self.capitalization: bool = capitalization
         self.suffix_length: int = max(0, int(suffix_length))
-        self.vocabulary: List[str] = vocabulary
+        self.vocabulary: Sequence[str] = vocabulary
 
-        # Use an independent RNG seeded at construction so the generator is deterministic
-        # per instance (useful when stored in session state)
-        if rng_seed is None:
-            rng_seed = random.SystemRandom().randint(0, 2**64 - 1)
-        self._rng = random.Random(rng_seed)
+        # Draw from the OS CSPRNG by default; an explicit rng_seed opts into a deterministic
+        # (and therefore non-secret) per-instance generator, e.g. for reproducible output
+        self._rng: random.Random = _rng if rng_seed is None else random.Random(rng_seed)
 
     def generate(self) -> str:
         """
         Generate a password from a list of vocabulary words.
         """
-        password_words = [self._rng.choice(self.vocabulary) for _ in range(self.no_of_words)]
+        password_words = self._rng.choices(self.vocabulary, k=self.no_of_words)
 
         if self.capitalization:
             # Capitalize first letter of each word for readability
             password_words = [w.capitalize() for w in password_words]
+        else:
+            # The NLTK corpus contains proper nouns; keep uncapitalized passwords all lowercase
+            password_words = [w.lower() for w in password_words]
 
         password = self.separator.join(password_words)
 
         if self.suffix_length > 0:
-            suffix = ''.join(self._rng.choice(string.digits) for _ in range(self.suffix_length))
+            suffix = ''.join(self._rng.choices(string.digits, k=self.suffix_length))
             password = f"{password}{suffix}"
 
         return password
@@ -108,33 +166,33 @@ class PinCodeGenerator(PasswordGenerator):
     """
     def __init__(self, length: int = 4):
         self.length: int = length
+        self._blocked: frozenset = self._disallowed_pins(length)
 
-    def generate(self) -> str:
+    @staticmethod
+    def _disallowed_pins(length: int) -> frozenset:
         """
-        Generate a numeric pin code.
+        Enumerate common, repeating and sequential PINs of the given length.
         """
         # Block common or insecure PINs and avoid sequential/repeating digits
         blocked = {"1234", "0000", "1111", "2580"}
+        if length >= 1:
+            blocked.update(d * length for d in string.digits)
+        if length >= 2:
+            # strictly ascending or descending by 1 (no wrap)
+            for start in range(10 - length + 1):
+                run = string.digits[start:start + length]
+                blocked.add(run)
+                blocked.add(run[::-1])
+        return frozenset(blocked)
 
-        def is_repeating(pin: str) -> bool:
-            return len(set(pin)) == 1
-
-        def is_sequential(pin: str) -> bool:
-            # detect strictly ascending or descending by 1 (no wrap)
-            if len(pin) < 2:
-                return False
-            diffs = [int(pin[i+1]) - int(pin[i]) for i in range(len(pin)-1)]
-            return all(d == 1 for d in diffs) or all(d == -1 for d in diffs)
-
+    def generate(self) -> str:
+        """
+        Generate a numeric pin code.
+        """
         max_attempts = 1000
         for _ in range(max_attempts):
-            pin = ''.join(random.choice(string.digits) for _ in range(self.length))
-            if pin in blocked:
-                continue
-            if is_repeating(pin):
-                continue
-            if is_sequential(pin):
-                continue
-            return pin
+            pin = _random_digits(self.length)
+            if pin not in self._blocked:
+                return pin
 
         raise ValueError(f"Unable to generate a secure PIN after {max_attempts} attempts. Try a different length.")